@@ -1,31 +1,39 @@
 """
 Transcription router — core speech-to-text endpoints.
 """
+import asyncio
+import os
 from typing import Annotated
 
+import pybase64
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
 
 from app.api.deps import get_whisper_service
 from app.core.config import get_settings
 from app.core.logging import get_logger
-from app.models.transcription import TranscriptionResponse, WhisperModel
-from app.services.whisper_service import SUPPORTED_AUDIO_TYPES, WhisperService
+from app.models.transcription import TranscriptionResponse
+from app.services.whisper_service import (
+    SUPPORTED_AUDIO_MIMES,
+    SUPPORTED_AUDIO_MIMES_STR,
+    WhisperService,
+)
 
 router = APIRouter(prefix="/transcribe", tags=["Transcription"])
 logger = get_logger(__name__)
 settings = get_settings()
 
-_MAX_BYTES = settings.MAX_UPLOAD_SIZE_MB * 1024 * 1024  # bytes
+_MAX_UPLOAD_SIZE_MB = settings.MAX_UPLOAD_SIZE_MB
+_MAX_BYTES = _MAX_UPLOAD_SIZE_MB * 1024 * 1024  # bytes
+_B64_OFFLOAD_THRESHOLD = 1_000_000  # chars; larger payloads decode off the event loop
 
 
 def _validate_audio_file(file: UploadFile) -> None:
     """Raise HTTPException for unsupported content type."""
     ct = (file.content_type or "").lower().split(";")[0].strip()
-    if ct and ct not in SUPPORTED_AUDIO_TYPES:
-        supported = ", ".join(sorted(SUPPORTED_AUDIO_TYPES))
+    if ct and ct not in SUPPORTED_AUDIO_MIMES:
         raise HTTPException(
             status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
-            detail=f"Unsupported audio type '{ct}'. Supported: {supported}",
+            detail=f"Unsupported audio type '{ct}'. Supported: {SUPPORTED_AUDIO_MIMES_STR}",
         )
 
 
@@ -59,14 +67,18 @@ async def transcribe_audio(
 ) -> TranscriptionResponse:
     _validate_audio_file(audio)
 
-    # Read and size-check
-    file_bytes = await audio.read()
-    if len(file_bytes) > _MAX_BYTES:
+    # The upload is already spooled by Starlette (to disk past 1 MB); size-check
+    # it in place and hand the file object to the decoder without copying it
+    # into a bytes object
+    audio.file.seek(0, os.SEEK_END)
+    size = audio.file.tell()
+    audio.file.seek(0)
+    if size > _MAX_BYTES:
         raise HTTPException(
             status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"File too large. Maximum allowed size is {settings.MAX_UPLOAD_SIZE_MB} MB.",
+            detail=f"File too large. Maximum allowed size is {_MAX_UPLOAD_SIZE_MB} MB.",
         )
-    if len(file_bytes) == 0:
+    if size == 0:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Uploaded file is empty.",
@@ -75,12 +87,12 @@ async def transcribe_audio(
     logger.info(
         "Received audio | filename=%s size=%d bytes language=%s",
         audio.filename,
-        len(file_bytes),
+        size,
         language or "auto",
     )
 
     result = await whisper_service.transcribe_file(
-        file_bytes=file_bytes,
+        audio_source=audio.file,
         filename=audio.filename or "audio.wav",
         language=language,
     )
@@ -89,9 +101,6 @@ async def transcribe_audio(
 
 # ── POST /transcribe/base64 ──────────────────────────────────────────────────
 
-import base64  # noqa: E402 – kept near usage
-
-
 @router.post(
     "/base64",
     response_model=TranscriptionResponse,
@@ -122,7 +131,11 @@ async def transcribe_base64(
             detail="'audio_base64' field is required.",
         )
     try:
-        file_bytes = base64.b64decode(audio_b64)
+        if len(audio_b64) > _B64_OFFLOAD_THRESHOLD:
+            loop = asyncio.get_running_loop()
+            file_bytes = await loop.run_in_executor(None, pybase64.b64decode, audio_b64)
+        else:
+            file_bytes = pybase64.b64decode(audio_b64)
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -132,7 +145,7 @@ async def transcribe_base64(
     if len(file_bytes) > _MAX_BYTES:
         raise HTTPException(
             status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"Decoded audio too large. Maximum: {settings.MAX_UPLOAD_SIZE_MB} MB.",
+            detail=f"Decoded audio too large. Maximum: {_MAX_UPLOAD_SIZE_MB} MB.",
         )
 
     filename: str = payload.get("filename", "audio.wav")
@@ -146,7 +159,7 @@ async def transcribe_base64(
     )
 
     return await whisper_service.transcribe_file(
-        file_bytes=file_bytes,
+        audio_source=file_bytes,
         filename=filename,
         language=language,
     )
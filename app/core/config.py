@@ -6,12 +6,16 @@ import warnings
 from functools import lru_cache
 from typing import Literal
 
-from pydantic import field_validator
+from pydantic import field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # faster-whisper (CTranslate2) only supports these devices
 _SUPPORTED_DEVICES = {"cpu", "cuda"}
 
+# Half-precision compute types need CUDA tensor cores; CTranslate2 has no
+# fast CPU kernels for them
+_CUDA_ONLY_COMPUTE_TYPES = {"float16", "int8_float16"}
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
@@ -40,8 +44,14 @@ class Settings(BaseSettings):
         "tiny", "base", "small", "medium", "large", "large-v2", "large-v3"
     ] = "base"
     WHISPER_DEVICE: str = "cpu"   # "cpu" | "cuda"  (mps is NOT supported by faster-whisper)
-    WHISPER_COMPUTE_TYPE: str = "int8"  # "int8" | "float16" | "float32"
+    # "int8" | "int8_float16" | "float16" | "float32"
+    # Default: "int8" on CPU, "int8_float16" on CUDA (int8 weights, fp16 tensor-core math)
+    WHISPER_COMPUTE_TYPE: str = "int8"
     WHISPER_LANGUAGE: str | None = None  # None → auto-detect
+    WHISPER_BEAM_SIZE: int = 5  # 1 → greedy decoding, much faster on CPU
+    WHISPER_VAD_MIN_SILENCE_MS: int = 500  # silence needed to split VAD chunks
+    # Parallel workers for files > 3 min, split on silence (1 → disabled)
+    WHISPER_CHUNK_WORKERS: int = 1
 
     @field_validator("WHISPER_DEVICE", mode="before")
     @classmethod
@@ -57,6 +67,22 @@ class Settings(BaseSettings):
             return "cpu"
         return device
 
+    @model_validator(mode="after")
+    def validate_compute_type(self) -> "Settings":
+        compute_type = self.WHISPER_COMPUTE_TYPE.strip().lower()
+        explicit = "WHISPER_COMPUTE_TYPE" in self.model_fields_set
+        if self.WHISPER_DEVICE == "cuda" and compute_type == "int8" and not explicit:
+            compute_type = "int8_float16"
+        elif self.WHISPER_DEVICE == "cpu" and compute_type in _CUDA_ONLY_COMPUTE_TYPES:
+            warnings.warn(
+                f"WHISPER_COMPUTE_TYPE='{self.WHISPER_COMPUTE_TYPE}' requires a CUDA device. "
+                "Falling back to 'int8' on CPU.",
+                stacklevel=2,
+            )
+            compute_type = "int8"
+        self.WHISPER_COMPUTE_TYPE = compute_type
+        return self
+
     # ── Upload limits ─────────────────────────────────────────────────
     MAX_UPLOAD_SIZE_MB: int = 25  # max audio file size in MB
 
@@ -5,12 +5,14 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 
 from app.api import health, transcribe
 from app.api.deps import get_whisper_service
 from app.core.config import get_settings
 from app.core.logging import get_logger, setup_logging
+from app.services.whisper_service import ServiceBusyError
 
 settings = get_settings()
 setup_logging()
@@ -28,6 +30,7 @@ async def lifespan(app: FastAPI):
     logger.info("Service ready ✓")
     yield
     logger.info("Shutting down.")
+    svc.shutdown()
 
 
 # ── App factory ───────────────────────────────────────────────────────────────
@@ -52,6 +55,19 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Compress large JSON responses (long transcripts carry many segments)
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+    # Inference queue full → tell the client to back off
+    @app.exception_handler(ServiceBusyError)
+    async def service_busy_handler(request: Request, exc: ServiceBusyError):
+        logger.warning("Rejected %s %s: %s", request.method, request.url, exc)
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": "Service is busy, please retry later.", "error_code": "SERVICE_BUSY"},
+            headers={"Retry-After": "1"},
+        )
+
     # Global exception handler
     @app.exception_handler(Exception)
     async def unhandled_exception_handler(request: Request, exc: Exception):
@@ -7,13 +7,17 @@ footprint.
 """
 import asyncio
 import io
+import itertools
 import os
-import tempfile
 import time
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import BinaryIO
 
-from faster_whisper import WhisperModel
+import numpy as np
+from faster_whisper import BatchedInferencePipeline, WhisperModel
+from faster_whisper.audio import decode_audio
+from faster_whisper.transcribe import TranscriptionInfo
+from faster_whisper.vad import VadOptions, get_speech_timestamps
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
@@ -21,6 +25,24 @@ from app.models.transcription import TranscriptionResponse, TranscriptionSegment
 
 logger = get_logger(__name__)
 
+# Whisper expects 16 kHz mono float32 PCM
+SAMPLE_RATE = 16000
+
+# Number of VAD chunks decoded together by BatchedInferencePipeline
+_BATCH_SIZES: dict[str, int] = {"cpu": 16, "cuda": 32}
+
+# In-flight requests (running + queued) admitted per worker; beyond this
+# new requests are rejected with ServiceBusyError
+_QUEUE_DEPTH_PER_WORKER = 4
+
+# Audio longer than this is split on silence and the chunks transcribed in
+# parallel (only when WHISPER_CHUNK_WORKERS > 1)
+_CHUNK_MIN_AUDIO_S = 180
+_CHUNK_MAX_S = 120
+
+# Whisper's input window; language detection looks at this much speech
+_WHISPER_WINDOW_S = 30
+
 # Supported audio MIME types → file extension
 SUPPORTED_AUDIO_TYPES: dict[str, str] = {
     "audio/wav": ".wav",
@@ -36,16 +58,103 @@ SUPPORTED_AUDIO_TYPES: dict[str, str] = {
     "video/webm": ".webm",
     "video/mp4": ".mp4",
 }
+SUPPORTED_AUDIO_MIMES: frozenset[str] = frozenset(SUPPORTED_AUDIO_TYPES)
+SUPPORTED_AUDIO_MIMES_STR = ", ".join(sorted(SUPPORTED_AUDIO_MIMES))
+
+
+class ServiceBusyError(RuntimeError):
+    """Raised when the transcription queue is full."""
+
+
+def _maybe_chunk(
+    pcm: np.ndarray,
+    vad_params: dict,
+    sr: int = SAMPLE_RATE,
+) -> list[tuple[float, np.ndarray, list[dict] | None]]:
+    """
+    Split long audio into clips of at most ``_CHUNK_MAX_S`` seconds, cutting
+    in the middle of silent gaps where possible.
+
+    Returns ``(offset_seconds, clip, speech_regions)`` tuples in order, where
+    ``speech_regions`` are the clip's VAD speech regions in samples, relative
+    to the clip. Audio shorter than ``_CHUNK_MIN_AUDIO_S`` is returned as a
+    single clip with ``speech_regions=None``. The regions only drive the cut
+    points and language detection; the pipeline still runs its own VAD on
+    each clip.
+    """
+    if len(pcm) <= _CHUNK_MIN_AUDIO_S * sr:
+        return [(0.0, pcm, None)]
+
+    max_len = _CHUNK_MAX_S * sr
+    speech = get_speech_timestamps(pcm, VadOptions(**vad_params), sampling_rate=sr)
+    # Candidate cut points: the middle of each gap between speech regions
+    cuts = [(a["end"] + b["start"]) // 2 for a, b in itertools.pairwise(speech)]
+
+    bounds = [0]
+    prev: int | None = None
+    for cut in [*cuts, len(pcm)]:
+        while cut - bounds[-1] > max_len:
+            # Cut at the last silence that fits, or hard-cut if there is none
+            if prev is not None and prev > bounds[-1]:
+                bounds.append(prev)
+            else:
+                bounds.append(bounds[-1] + max_len)
+        prev = cut
+
+    chunks = []
+    ends = [*bounds[1:], len(pcm)]
+    for start, end in zip(bounds, ends):
+        # Speech regions overlapping this clip, clipped and made clip-relative
+        regions = [
+            {"start": max(r["start"], start) - start, "end": min(r["end"], end) - start}
+            for r in speech
+            if r["end"] > start and r["start"] < end
+        ]
+        chunks.append((start / sr, pcm[start:end], regions))
+    return chunks
 
 
 class WhisperService:
     """Singleton-style service that loads and caches the Whisper model."""
 
-    _model: WhisperModel | None = None
+    _model: BatchedInferencePipeline | None = None
     _model_name: str | None = None
 
     def __init__(self) -> None:
         self._settings = get_settings()
+        self._default_language = self._settings.WHISPER_LANGUAGE
+        self._beam_size = self._settings.WHISPER_BEAM_SIZE
+        self._batch_size = _BATCH_SIZES.get(self._settings.WHISPER_DEVICE, 16)
+        self._vad_params = {
+            "min_silence_duration_ms": self._settings.WHISPER_VAD_MIN_SILENCE_MS,
+        }
+
+        # One inference at a time on GPU; on CPU split the cores so that
+        # workers × CT2 threads per worker never exceeds the core count.
+        cores = os.cpu_count() or 1
+        if self._settings.WHISPER_DEVICE == "cuda":
+            self._max_workers = 1
+        else:
+            self._max_workers = max(1, cores // 4)
+        self._cpu_threads = max(1, cores // self._max_workers)
+        # Sized for the common single-chunk path; a chunked long file
+        # oversubscribes the cores by up to WHISPER_CHUNK_WORKERS×
+        self._chunk_workers = max(1, self._settings.WHISPER_CHUNK_WORKERS)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_workers,
+            thread_name_prefix="whisper",
+        )
+        # Fans the chunks of a single long file out over the shared model
+        self._chunk_executor = (
+            ThreadPoolExecutor(
+                max_workers=self._chunk_workers,
+                thread_name_prefix="whisper-chunk",
+            )
+            if self._chunk_workers > 1
+            else None
+        )
+        self._semaphore = asyncio.Semaphore(self._max_workers * _QUEUE_DEPTH_PER_WORKER)
 
     # ── Model lifecycle ───────────────────────────────────────────────
 
@@ -56,21 +165,54 @@ class WhisperService:
         compute_type = self._settings.WHISPER_COMPUTE_TYPE
 
         logger.info(
-            "Loading Whisper model '%s' on device='%s' compute_type='%s' …",
+            "Loading Whisper model '%s' on device='%s' compute_type='%s' "
+            "workers=%d cpu_threads=%d …",
             model_name,
             device,
             compute_type,
+            self._max_workers,
+            self._cpu_threads,
         )
         t0 = time.perf_counter()
-        WhisperService._model = WhisperModel(
+        raw_model = WhisperModel(
             model_name,
             device=device,
             compute_type=compute_type,
+            cpu_threads=self._cpu_threads,
+            num_workers=self._max_workers * self._chunk_workers,
         )
+        # Batch VAD chunks through the encoder/decoder instead of one at a time
+        WhisperService._model = BatchedInferencePipeline(model=raw_model)
         WhisperService._model_name = model_name
         elapsed = time.perf_counter() - t0
         logger.info("Whisper model loaded in %.2f s", elapsed)
 
+        self._warm_up(raw_model)
+
+    def _warm_up(self, raw_model: WhisperModel) -> None:
+        """
+        Run one second of silence through the model and the VAD so kernel
+        initialisation and the VAD model load are paid at startup rather than
+        by the first request.
+        """
+        t0 = time.perf_counter()
+        silence = np.zeros(SAMPLE_RATE, dtype=np.float32)
+        # The batched pipeline skips the model entirely on silent input, so
+        # warm the underlying model directly with VAD disabled
+        segments_iter, _ = raw_model.transcribe(
+            silence, language="en", beam_size=1, vad_filter=False
+        )
+        for _ in segments_iter:
+            pass
+        get_speech_timestamps(silence, VadOptions(**self._vad_params))
+        logger.info("Whisper model warmed up in %.2f s", time.perf_counter() - t0)
+
+    def shutdown(self) -> None:
+        """Stop the inference thread pools (called once at shutdown)."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        if self._chunk_executor is not None:
+            self._chunk_executor.shutdown(wait=True, cancel_futures=True)
+
     @property
     def is_loaded(self) -> bool:
         return WhisperService._model is not None
@@ -83,88 +225,154 @@ class WhisperService:
 
     async def transcribe_file(
         self,
-        file_bytes: bytes,
+        audio_source: bytes | BinaryIO,
         filename: str,
         language: str | None = None,
     ) -> TranscriptionResponse:
         """
-        Async wrapper — runs blocking transcription in a thread-pool executor
-        so the FastAPI event loop is never blocked.
+        Async wrapper — runs blocking transcription in a dedicated, bounded
+        thread-pool executor so the FastAPI event loop is never blocked and
+        concurrent requests do not oversubscribe the device.
+
+        Raises ServiceBusyError instead of queueing when every slot is taken.
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            self._transcribe_sync,
-            file_bytes,
-            filename,
-            language,
-        )
+        if self._semaphore.locked():
+            raise ServiceBusyError("Transcription queue is full.")
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor,
+                self._transcribe_sync,
+                audio_source,
+                filename,
+                language,
+            )
 
     def _transcribe_sync(
         self,
-        file_bytes: bytes,
+        audio_source: bytes | BinaryIO,
         filename: str,
         language: str | None,
     ) -> TranscriptionResponse:
         if WhisperService._model is None:
             raise RuntimeError("Whisper model is not loaded yet.")
 
-        settings = self._settings
+        # Decode in-process to 16 kHz mono PCM — no temp file round-trip
+        if isinstance(audio_source, (bytes, bytearray)):
+            audio_source = io.BytesIO(audio_source)
+        audio = decode_audio(audio_source, sampling_rate=SAMPLE_RATE)
 
-        # Determine file extension from original filename
-        suffix = Path(filename).suffix or ".wav"
+        t0 = time.perf_counter()
+        forced_lang = language or self._default_language
 
-        # Write bytes to a named temp file (whisper needs a filesystem path)
-        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-            tmp.write(file_bytes)
-            tmp_path = tmp.name
+        chunks = (
+            _maybe_chunk(audio, self._vad_params)
+            if self._chunk_executor
+            else [(0.0, audio, None)]
+        )
+        if len(chunks) > 1:
+            # Resolve the language once so every chunk is decoded in it
+            chunk_lang = forced_lang or self._detect_language(chunks)
+            results = list(
+                self._chunk_executor.map(
+                    lambda chunk: self._transcribe_chunk(chunk[1], chunk_lang, chunk[0]),
+                    chunks,
+                )
+            )
+        else:
+            results = [self._transcribe_chunk(audio, forced_lang, 0.0)]
 
-        try:
-            t0 = time.perf_counter()
-            forced_lang = language or settings.WHISPER_LANGUAGE
+        info = results[0][1]
+        duration = sum(chunk_info.duration for _, chunk_info in results)
 
-            segments_iter, info = WhisperService._model.transcribe(
-                tmp_path,
-                language=forced_lang,
-                beam_size=5,
-                vad_filter=True,          # skip silent regions
-                vad_parameters=dict(min_silence_duration_ms=500),
-                word_timestamps=False,
-            )
+        # Plain dicts here; values are already typed and rounded, so the
+        # response is built below without re-running validation
+        segments: list[dict] = []
+        full_text_parts: list[str] = []
 
-            segments: list[TranscriptionSegment] = []
-            full_text_parts: list[str] = []
-
-            for seg in segments_iter:
-                segments.append(
-                    TranscriptionSegment(
-                        id=seg.id,
-                        start=round(seg.start, 3),
-                        end=round(seg.end, 3),
-                        text=seg.text.strip(),
-                        avg_logprob=round(seg.avg_logprob, 4),
-                        no_speech_prob=round(seg.no_speech_prob, 4),
-                    )
-                )
-                full_text_parts.append(seg.text.strip())
+        for chunk_segments, _ in results:
+            for seg in chunk_segments:
+                seg["id"] = len(segments)
+                segments.append(seg)
+                full_text_parts.append(seg["text"])
 
-            elapsed = time.perf_counter() - t0
-            full_text = " ".join(full_text_parts)
+        elapsed = time.perf_counter() - t0
+        full_text = " ".join(full_text_parts)
 
-            logger.info(
-                "Transcription done | lang=%s duration=%.1fs segments=%d elapsed=%.2fs",
-                info.language,
-                info.duration,
-                len(segments),
-                elapsed,
-            )
+        logger.info(
+            "Transcription done | filename=%s lang=%s duration=%.1fs chunks=%d "
+            "segments=%d elapsed=%.2fs",
+            filename,
+            info.language,
+            duration,
+            len(results),
+            len(segments),
+            elapsed,
+        )
+
+        return TranscriptionResponse.model_construct(
+            text=full_text,
+            language=info.language,
+            duration=round(duration, 3),
+            model=self.model_name,
+            segments=[TranscriptionSegment.model_construct(**seg) for seg in segments],
+        )
+
+    def _detect_language(
+        self,
+        chunks: list[tuple[float, np.ndarray, list[dict] | None]],
+    ) -> str:
+        """Detect the language from the first window of speech across ``chunks``."""
+        whisper_model = WhisperService._model.model
+        if not whisper_model.model.is_multilingual:
+            return "en"
+
+        window = _WHISPER_WINDOW_S * SAMPLE_RATE
+        speech = (
+            clip[region["start"]:region["end"]]
+            for _, clip, speech_regions in chunks
+            for region in speech_regions or []
+        )
+        head: list[np.ndarray] = []
+        n_samples = 0
+        for region in speech:
+            head.append(region)
+            n_samples += len(region)
+            if n_samples >= window:
+                break
+
+        audio = np.concatenate(head) if head else chunks[0][1]
+        language, _, _ = whisper_model.detect_language(audio=audio)
+        return language
+
+    def _transcribe_chunk(
+        self,
+        audio: np.ndarray,
+        language: str | None,
+        offset: float,
+    ) -> tuple[list[dict], TranscriptionInfo]:
+        """Transcribe one clip, shifting segment timestamps by ``offset`` seconds."""
+        segments_iter, info = WhisperService._model.transcribe(
+            audio,
+            language=language,
+            beam_size=self._beam_size,
+            batch_size=self._batch_size,
+            vad_filter=True,          # skip silent regions
+            vad_parameters=self._vad_params,
+            without_timestamps=False,  # keep sentence-level segments, not one per VAD chunk
+            word_timestamps=False,
+        )
 
-            return TranscriptionResponse(
-                text=full_text,
-                language=info.language,
-                duration=round(info.duration, 3),
-                model=self.model_name,
-                segments=segments,
+        segments: list[dict] = []
+        for seg in segments_iter:
+            segments.append(
+                {
+                    "id": seg.id,
+                    "start": round(seg.start + offset, 3),
+                    "end": round(seg.end + offset, 3),
+                    "text": seg.text.strip(),
+                    "avg_logprob": round(seg.avg_logprob, 4),
+                    "no_speech_prob": round(seg.no_speech_prob, 4),
+                }
             )
-        finally:
-            os.unlink(tmp_path)
+        return segments, info
@@ -2,14 +2,22 @@
 Integration tests for the STT microservice.
 Run with:  pytest tests/ -v
 """
+import asyncio
 import io
 import struct
 import wave
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 
+import numpy as np
 import pytest
 from fastapi.testclient import TestClient
 
+from app.api.deps import get_whisper_service
+from app.core.config import Settings
 from app.main import app
+from app.services import whisper_service
+from app.services.whisper_service import SAMPLE_RATE, WhisperService, _maybe_chunk
 
 
 @pytest.fixture(scope="session")
@@ -96,6 +104,15 @@ class TestTranscription:
         body = r.json()
         assert "text" in body
 
+    def test_transcribe_rejected_when_queue_full(self, client, monkeypatch):
+        monkeypatch.setattr(get_whisper_service(), "_semaphore", asyncio.Semaphore(0))
+        r = client.post(
+            "/api/v1/transcribe/",
+            files={"audio": ("test.wav", _make_silent_wav(), "audio/wav")},
+        )
+        assert r.status_code == 503
+        assert r.json()["error_code"] == "SERVICE_BUSY"
+
     def test_transcribe_base64_missing_field(self, client):
         r = client.post("/api/v1/transcribe/base64", json={})
         assert r.status_code == 400
@@ -106,3 +123,109 @@ class TestTranscription:
             json={"audio_base64": "!!!not-valid-base64!!!"},
         )
         assert r.status_code == 400
+
+
+# ── Chunking ──────────────────────────────────────────────────────────────────
+
+_VAD_PARAMS = {"min_silence_duration_ms": 500}
+
+
+class _StubPipeline:
+    """Stands in for BatchedInferencePipeline: two fixed segments per clip."""
+
+    def __init__(self, detected_language: str) -> None:
+        self.model = SimpleNamespace(
+            model=SimpleNamespace(is_multilingual=True),
+            detect_language=lambda audio: (detected_language, 0.9, []),
+        )
+        self.languages: list[str | None] = []
+
+    def transcribe(self, audio, language=None, **kwargs):
+        self.languages.append(language)
+        segments = [
+            SimpleNamespace(
+                id=i,
+                start=float(i * 10),
+                end=float(i * 10 + 5),
+                text=f" seg{i} ",
+                avg_logprob=-0.1,
+                no_speech_prob=0.01,
+            )
+            for i in range(2)
+        ]
+        info = SimpleNamespace(language=language, duration=len(audio) / SAMPLE_RATE)
+        return iter(segments), info
+
+
+class TestChunking:
+    def test_short_audio_is_single_chunk(self):
+        pcm = np.zeros(10 * SAMPLE_RATE, dtype=np.float32)
+        chunks = _maybe_chunk(pcm, _VAD_PARAMS)
+        assert len(chunks) == 1
+        assert chunks[0][0] == 0.0
+
+    def test_long_silent_audio_is_hard_cut(self):
+        pcm = np.zeros(300 * SAMPLE_RATE, dtype=np.float32)
+        chunks = _maybe_chunk(pcm, _VAD_PARAMS)
+        assert [offset for offset, _, _ in chunks] == [0.0, 120.0, 240.0]
+        assert sum(len(clip) for _, clip, _ in chunks) == len(pcm)
+
+    def test_cuts_land_in_silent_gaps(self, monkeypatch):
+        speech_s = [(0, 50), (55, 110), (115, 170), (175, 250), (255, 300)]
+        speech = [{"start": a * SAMPLE_RATE, "end": b * SAMPLE_RATE} for a, b in speech_s]
+        monkeypatch.setattr(
+            whisper_service,
+            "get_speech_timestamps",
+            lambda *args, **kwargs: [dict(r) for r in speech],
+        )
+
+        pcm = np.zeros(300 * SAMPLE_RATE, dtype=np.float32)
+        chunks = _maybe_chunk(pcm, _VAD_PARAMS)
+
+        offsets = [offset for offset, _, _ in chunks]
+        assert offsets == [0.0, 112.5, 172.5, 252.5]
+        for offset in offsets[1:]:
+            assert not any(a < offset < b for a, b in speech_s)
+        for _, clip, speech_regions in chunks:
+            assert len(clip) <= 120 * SAMPLE_RATE
+            assert speech_regions
+            assert all(0 <= r["start"] < r["end"] <= len(clip) for r in speech_regions)
+
+    def test_chunk_results_are_merged(self, monkeypatch):
+        pcm = np.zeros(300 * SAMPLE_RATE, dtype=np.float32)
+        chunks = [
+            (0.0, pcm[: 120 * SAMPLE_RATE], []),
+            (120.0, pcm[120 * SAMPLE_RATE : 220 * SAMPLE_RATE], []),
+            (220.0, pcm[220 * SAMPLE_RATE :], []),
+        ]
+        stub = _StubPipeline(detected_language="fr")
+        monkeypatch.setattr(WhisperService, "_model", stub)
+        monkeypatch.setattr(whisper_service, "decode_audio", lambda source, **kwargs: pcm)
+        monkeypatch.setattr(whisper_service, "_maybe_chunk", lambda audio, vad_params: chunks)
+
+        svc = WhisperService()
+        monkeypatch.setattr(svc, "_default_language", None)
+        with ThreadPoolExecutor(max_workers=2) as chunk_executor:
+            monkeypatch.setattr(svc, "_chunk_executor", chunk_executor)
+            result = svc._transcribe_sync(b"", "long.wav", None)
+
+        assert [seg.id for seg in result.segments] == list(range(6))
+        assert [seg.start for seg in result.segments] == [0.0, 10.0, 120.0, 130.0, 220.0, 230.0]
+        assert [seg.end for seg in result.segments] == [5.0, 15.0, 125.0, 135.0, 225.0, 235.0]
+        assert result.duration == 300.0
+        assert result.language == "fr"
+        assert stub.languages == ["fr", "fr", "fr"]
+        assert result.text == "seg0 seg1 seg0 seg1 seg0 seg1"
+
+
+# ── Config ────────────────────────────────────────────────────────────────────
+
+class TestConfig:
+    def test_cuda_defaults_to_int8_float16(self):
+        s = Settings(_env_file=None, WHISPER_DEVICE="cuda")
+        assert s.WHISPER_COMPUTE_TYPE == "int8_float16"
+
+    def test_half_precision_on_cpu_falls_back(self):
+        with pytest.warns(UserWarning):
+            s = Settings(_env_file=None, WHISPER_DEVICE="cpu", WHISPER_COMPUTE_TYPE="float16")
+        assert s.WHISPER_COMPUTE_TYPE == "int8"